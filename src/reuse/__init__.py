@@ -23,7 +23,7 @@ import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any, Dict, NamedTuple, Optional, Set, Type
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Type
 
 from boolean.boolean import Expression
 
@@ -87,6 +87,35 @@ _IGNORE_SPDX_PATTERNS = [
 _IGNORE_FILE_PATTERNS.extend(_IGNORE_SPDX_PATTERNS)
 
 
+def _union_of_patterns(patterns: Iterable[re.Pattern]) -> re.Pattern:
+    """Compile *patterns* into a single pattern that matches wherever any of
+    *patterns* matches, so that a name is matched in one pass rather than once
+    per pattern.
+
+    If *patterns* is empty, the returned pattern never matches.
+
+    Raises:
+        ValueError: if *patterns* do not all have the same flags.
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return re.compile(r"(?!)")
+    flags = {pattern.flags for pattern in patterns}
+    if len(flags) > 1:
+        raise ValueError("cannot combine patterns that have different flags")
+    return re.compile(
+        "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+        flags.pop(),
+    )
+
+
+_IGNORE_DIR_PATTERN = _union_of_patterns(_IGNORE_DIR_PATTERNS)
+_IGNORE_FILE_PATTERN = _union_of_patterns(_IGNORE_FILE_PATTERNS)
+_IGNORE_MESON_PARENT_DIR_PATTERN = _union_of_patterns(
+    _IGNORE_MESON_PARENT_DIR_PATTERNS
+)
+
+
 class SourceType(Enum):
     """
     An enumeration representing the types of sources for license information.
@@ -22,8 +22,10 @@ import sys
 from argparse import ArgumentTypeError
 from collections import Counter
 from difflib import SequenceMatcher
+from functools import lru_cache
 from gettext import gettext as _
 from hashlib import sha1
+from io import StringIO
 from itertools import chain
 from os import PathLike
 from pathlib import Path, PurePath
@@ -32,18 +34,22 @@ from typing import (
     Any,
     BinaryIO,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from boolean.boolean import Expression, ParseError
 from debian.copyright import Copyright
 from debian.copyright import Error as DebianError
+from debian.copyright import FilesParagraph
 from license_expression import ExpressionError, Licensing
 
 from . import ReuseInfo, SourceType
@@ -70,6 +76,13 @@ SPDX_SNIPPET_INDICATOR = b"SPDX-SnippetBegin"
 
 _LOGGER = logging.getLogger(__name__)
 _LICENSING = Licensing()
+# Parsed SPDX expressions, keyed by their canonical string form, so that equal
+# expressions share a single object.
+_EXPRESSION_INTERN: "WeakValueDictionary[str, Expression]" = (
+    WeakValueDictionary()
+)
+# Lookup data of each dep5 Copyright object, computed once per object.
+_DEP5_INDEXES: "WeakKeyDictionary[Copyright, _Dep5Index]" = WeakKeyDictionary()
 
 # REUSE-IgnoreStart
 
@@ -245,6 +258,27 @@ def _determine_license_suffix_path(path: StrPath) -> Path:
     return Path(f"{path}.license")
 
 
+@lru_cache(maxsize=4096)
+def _parse_license_cached(expression: str) -> Optional[Expression]:
+    """Parse *expression* with :data:`_LICENSING`, memoizing the result. The
+    same SPDX expressions tend to recur across many files, so there is no need
+    to parse them more than once.
+
+    Expressions that are written differently but have the same canonical form
+    (e.g., differing only in whitespace) are returned as the same object. An
+    empty expression returns None, as :meth:`Licensing.parse` does.
+
+    Raises:
+        ExpressionError: if *expression* could not be parsed.
+        ParseError: if *expression* could not be parsed.
+    """
+    parsed = _LICENSING.parse(expression)
+    # An empty expression parses to None, which cannot be weakly referenced.
+    if parsed is None:
+        return None
+    return _EXPRESSION_INTERN.setdefault(str(parsed), parsed)
+
+
 def _parse_dep5(path: StrPath) -> Copyright:
     """Parse the dep5 file and create a dep5 Copyright object.
 
@@ -255,8 +289,10 @@ def _parse_dep5(path: StrPath) -> Copyright:
     """
     path = Path(path)
     try:
-        with path.open(encoding="utf-8") as fp:
-            return Copyright(fp)
+        # Decode the whole file in one go instead of line by line. As with a
+        # file opened in text mode, translate all line endings to '\n'.
+        text = path.read_bytes().decode("utf-8")
+        return Copyright(StringIO(text, newline=None))
     except FileNotFoundError:
         _LOGGER.debug(_("no '{}' file, or could not read it").format(path))
         raise
@@ -270,26 +306,121 @@ def _parse_dep5(path: StrPath) -> Copyright:
 
 
 def _copyright_from_dep5(path: StrPath, dep5_copyright: Copyright) -> ReuseInfo:
-    """Find the reuse information of *path* in the dep5 Copyright object."""
-    path = PurePath(path).as_posix()
-    result = dep5_copyright.find_files_paragraph(path)
+    """Find the reuse information of *path* in the dep5 Copyright object.
 
-    if result is None:
+    Information about *dep5_copyright* is cached, so *dep5_copyright* should
+    not be modified after it has been passed to this function.
+
+    If *path* is a string, it should already be normalised (no '.' or empty
+    components).
+    """
+    # Avoid creating a PurePath for every lookup when it isn't needed.
+    if isinstance(path, PurePath):
+        path = path.as_posix()
+    elif isinstance(path, str):
+        if os.sep == "\\":
+            path = path.replace("\\", "/")
+    else:
+        path = PurePath(path).as_posix()
+    index = _dep5_index(dep5_copyright)
+    paragraph = index.find_paragraph(path)
+    if paragraph is None:
         return ReuseInfo()
 
+    spdx_expressions, copyright_lines = index.info_of_paragraph(paragraph)
     return ReuseInfo(
-        spdx_expressions=set(
-            map(_LICENSING.parse, [result.license.synopsis])  # type: ignore
-        ),
-        copyright_lines=set(
-            map(str.strip, result.copyright.splitlines())  # type: ignore
-        ),
+        spdx_expressions=set(spdx_expressions),
+        copyright_lines=set(copyright_lines),
         path=path,
         source_type=SourceType.DEP5,
         source_path=".reuse/dep5",
     )
 
 
+def _literal_prefix_of_glob(glob: str) -> str:
+    """Return the part of a dep5 Files *glob* that precedes its first wildcard
+    or escape sequence. Every path matched by *glob* starts with this prefix.
+    """
+    for index, char in enumerate(glob):
+        if char in "*?\\":
+            return glob[:index]
+    return glob
+
+
+# SPDX expressions and copyright lines of a Files paragraph in a dep5 file.
+_Dep5ParagraphInfo = Tuple[FrozenSet[Expression], FrozenSet[str]]
+
+
+class _Dep5Index:
+    """Data derived from a dep5 Copyright object that speeds up finding the
+    Files paragraph of a path and the REUSE information in that paragraph.
+    """
+
+    def __init__(self, dep5_copyright: Copyright):
+        paragraphs = list(dep5_copyright.all_files_paragraphs())
+        #: The literal prefixes of all Files globs. A path that starts with
+        #: none of them cannot be covered by the dep5 file.
+        self.prefixes: Tuple[str, ...] = tuple(
+            {
+                _literal_prefix_of_glob(glob)
+                for paragraph in paragraphs
+                for glob in paragraph.files
+            }
+        )
+        #: The Files paragraphs, last paragraph first.
+        self.paragraphs: Tuple[FilesParagraph, ...] = tuple(
+            reversed(paragraphs)
+        )
+        self._paragraph_info: Dict[FilesParagraph, _Dep5ParagraphInfo] = {}
+
+    def find_paragraph(self, path: str) -> Optional[FilesParagraph]:
+        """Return the Files paragraph that covers the POSIX *path*, or None.
+
+        This is equivalent to :meth:`Copyright.find_files_paragraph`, which
+        returns the last matching paragraph, but searches from the last
+        paragraph backwards and stops at the first match instead of trying
+        every paragraph.
+        """
+        # Only search the paragraphs if a glob could possibly match.
+        if not path.startswith(self.prefixes):
+            return None
+        for paragraph in self.paragraphs:
+            if paragraph.matches(path):
+                return paragraph
+        return None
+
+    def info_of_paragraph(
+        self, paragraph: FilesParagraph
+    ) -> _Dep5ParagraphInfo:
+        """Return the SPDX expressions and copyright lines of *paragraph*. The
+        result is cached, so that all files covered by the same paragraph share
+        it.
+        """
+        info = self._paragraph_info.get(paragraph)
+        if info is None:
+            synopsis: str = paragraph.license.synopsis  # type: ignore
+            info = (
+                frozenset({_parse_license_cached(synopsis)}),
+                frozenset(
+                    stripped
+                    for line in paragraph.copyright.splitlines()  # type: ignore
+                    if (stripped := line.strip())
+                ),
+            )
+            self._paragraph_info[paragraph] = info
+        return info
+
+
+def _dep5_index(dep5_copyright: Copyright) -> _Dep5Index:
+    """Return the :class:`_Dep5Index` of *dep5_copyright*, creating it the
+    first time.
+    """
+    index = _DEP5_INDEXES.get(dep5_copyright)
+    if index is None:
+        index = _DEP5_INDEXES[dep5_copyright] = _Dep5Index(dep5_copyright)
+    return index
+
+
 def _parse_copyright_year(year: str) -> list:
     """Parse copyright years and return list."""
     if not year:
@@ -407,7 +538,7 @@ def extract_reuse_info(text: str) -> ReuseInfo:
     copyright_matches = set()
     for expression in spdx_tags.pop("spdx_expressions"):
         try:
-            expressions.add(_LICENSING.parse(expression))
+            expressions.add(_parse_license_cached(expression))
         except (ExpressionError, ParseError):
             _LOGGER.error(
                 _("Could not parse '{expression}'").format(
@@ -24,9 +24,9 @@ from debian.copyright import Copyright
 from license_expression import ExpressionError
 
 from . import (
-    _IGNORE_DIR_PATTERNS,
-    _IGNORE_FILE_PATTERNS,
-    _IGNORE_MESON_PARENT_DIR_PATTERNS,
+    _IGNORE_DIR_PATTERN,
+    _IGNORE_FILE_PATTERN,
+    _IGNORE_MESON_PARENT_DIR_PATTERN,
     IdentifierNotFound,
     ReuseInfo,
     SourceType,
@@ -329,17 +329,16 @@ class Project:
         parent_parts = path.parent.parts
         parent_dir = parent_parts[-1] if len(parent_parts) > 0 else ""
         if path.is_file():
-            for pattern in _IGNORE_FILE_PATTERNS:
-                if pattern.match(name):
-                    return True
+            if _IGNORE_FILE_PATTERN.match(name):
+                return True
         elif path.is_dir():
-            for pattern in _IGNORE_DIR_PATTERNS:
-                if pattern.match(name):
-                    return True
-            if not self.include_meson_subprojects:
-                for pattern in _IGNORE_MESON_PARENT_DIR_PATTERNS:
-                    if pattern.match(parent_dir):
-                        return True
+            if _IGNORE_DIR_PATTERN.match(name):
+                return True
+            if (
+                not self.include_meson_subprojects
+                and _IGNORE_MESON_PARENT_DIR_PATTERN.match(parent_dir)
+            ):
+                return True
 
         if self.vcs_strategy.is_ignored(path):
             return True
@@ -355,6 +355,28 @@ def dep5_copyright():
         return Copyright(fp)
 
 
+@pytest.fixture()
+def make_dep5_copyright():
+    """Return a function that creates a dep5 Copyright object from the given
+    Files paragraphs, preceded by a fixed header paragraph.
+    """
+
+    def _make_dep5_copyright(files_paragraphs: str) -> Copyright:
+        header = cleandoc(
+            """
+            Format: something
+            Upstream-Name: example
+            Upstream-Contact: Jane Doe
+            Source: https://example.com
+            """
+        )
+        return Copyright(
+            StringIO(f"{header}\n\n{cleandoc(files_paragraphs)}\n")
+        )
+
+    return _make_dep5_copyright
+
+
 @pytest.fixture()
 def stringio():
     """Create a StringIO object."""
@@ -4,13 +4,47 @@
 
 """Tests for some core components."""
 
+import re
+
 import pytest
 
-from reuse import ReuseInfo, SourceType
+from reuse import ReuseInfo, SourceType, _union_of_patterns
 
 # REUSE-IgnoreStart
 
 
+def test_union_of_patterns_simple():
+    """The combined pattern matches if any of the patterns matches."""
+    pattern = _union_of_patterns([re.compile(r"^foo$"), re.compile(r"^bar")])
+    assert pattern.match("foo")
+    assert pattern.match("barbaz")
+    assert not pattern.match("foobar")
+
+
+def test_union_of_patterns_flags():
+    """Flags shared by all patterns are kept."""
+    pattern = _union_of_patterns(
+        [re.compile("foo", re.IGNORECASE), re.compile("bar", re.IGNORECASE)]
+    )
+    assert pattern.flags & re.IGNORECASE
+    assert pattern.match("BAR")
+
+
+def test_union_of_patterns_empty():
+    """An empty list of patterns results in a pattern that never matches."""
+    pattern = _union_of_patterns([])
+    assert not pattern.match("anything")
+    assert not pattern.match("")
+
+
+def test_union_of_patterns_different_flags():
+    """Patterns with different flags cannot be combined."""
+    with pytest.raises(ValueError):
+        _union_of_patterns(
+            [re.compile("foo", re.IGNORECASE), re.compile("bar")]
+        )
+
+
 def test_reuse_info_contains_copyright_or_licensing():
     """If either spdx_expressions or copyright_lines is truthy, expect True."""
     arguments = [
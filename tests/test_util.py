@@ -22,7 +22,7 @@ import pytest
 from boolean.boolean import ParseError
 from debian.copyright import Copyright
 from debian.copyright import Error as DebianError
-from license_expression import LicenseSymbol
+from license_expression import ExpressionError, LicenseSymbol
 
 from reuse import _util
 from reuse._util import _LICENSING
@@ -392,12 +392,53 @@ def test_filter_ignore_block_with_multiple_ignore_blocks():
     assert result == expected
 
 
+def test_parse_license_cached():
+    """Parsing the same expression twice returns the same object."""
+    result = _util._parse_license_cached("GPL-3.0-or-later OR MIT")
+    assert result == _LICENSING.parse("GPL-3.0-or-later OR MIT")
+    assert _util._parse_license_cached("GPL-3.0-or-later OR MIT") is result
+
+
+def test_parse_license_cached_same_canonical_form():
+    """Expressions that differ only in whitespace share one object."""
+    result = _util._parse_license_cached("MIT AND  CC0-1.0")
+    assert _util._parse_license_cached("MIT  AND CC0-1.0") is result
+
+
+def test_parse_license_cached_empty():
+    """An empty expression parses to None without raising."""
+    for expression in ["", "   "]:
+        assert _util._parse_license_cached(expression) is None
+
+
+def test_parse_license_cached_parse_error():
+    """Parse errors are raised on every call, not cached."""
+    for _ in range(2):
+        with pytest.raises(ExpressionError):
+            _util._parse_license_cached("MIT OR")
+
+
 def test_parse_dep5_simple(fake_repository):
     """No error if everything is good."""
     result = _util._parse_dep5(fake_repository / ".reuse/dep5")
     assert result.__class__ == Copyright
 
 
+def test_parse_dep5_crlf(empty_directory):
+    """Windows line endings are handled as in a file opened in text mode."""
+    (empty_directory / "foo").write_bytes(
+        b"Format: something\r\n"
+        b"Upstream-Name: example\r\n"
+        b"\r\n"
+        b"Files: *\r\n"
+        b"Copyright: 2017 Jane Doe\r\n"
+        b"License: MIT\r\n"
+    )
+    result = _util._parse_dep5(empty_directory / "foo")
+    paragraph = result.find_files_paragraph("foo.py")
+    assert paragraph.copyright == "2017 Jane Doe"
+
+
 def test_parse_dep5_not_exists(empty_directory):
     """Raise FileNotFoundError if .reuse/dep5 doesn't exist."""
     with pytest.raises(FileNotFoundError):
@@ -446,6 +487,107 @@ def test_copyright_from_dep5(dep5_copyright):
     assert "2017 Jane Doe" in result.copyright_lines
 
 
+def test_copyright_from_dep5_path_object(dep5_copyright):
+    """A Path is converted to its POSIX form."""
+    result = _util._copyright_from_dep5(Path("doc/foo.rst"), dep5_copyright)
+    assert result.path == "doc/foo.rst"
+    assert LicenseSymbol("CC0-1.0") in result.spdx_expressions
+
+
+def test_copyright_from_dep5_same_paragraph(dep5_copyright):
+    """Files covered by the same paragraph have equal information, but do not
+    share the same sets.
+    """
+    result = _util._copyright_from_dep5("doc/foo.rst", dep5_copyright)
+    other = _util._copyright_from_dep5("doc/bar.rst", dep5_copyright)
+    assert other.path == "doc/bar.rst"
+    assert other.spdx_expressions == result.spdx_expressions
+    assert other.copyright_lines == result.copyright_lines
+    assert other.copyright_lines is not result.copyright_lines
+
+
+def test_copyright_from_dep5_not_covered(dep5_copyright):
+    """A path that is not covered by the dep5 file has no information."""
+    result = _util._copyright_from_dep5("src/foo.py", dep5_copyright)
+    assert not result
+
+
+def test_copyright_from_dep5_outside_of_prefixes(make_dep5_copyright):
+    """Paths that cannot match any glob are not covered, and paths that match a
+    glob after its literal prefix still are.
+    """
+    dep5_copyright = make_dep5_copyright(
+        """
+        Files: src/*.py doc/ind?x.rst
+        Copyright: 2017 Jane Doe
+        License: MIT
+        """
+    )
+    assert set(_util._dep5_index(dep5_copyright).prefixes) == {
+        "src/",
+        "doc/ind",
+    }
+    assert not _util._copyright_from_dep5("../src/foo.py", dep5_copyright)
+    assert not _util._copyright_from_dep5("tests/foo.py", dep5_copyright)
+    assert _util._copyright_from_dep5("src/foo.py", dep5_copyright)
+    assert _util._copyright_from_dep5("doc/index.rst", dep5_copyright)
+
+
+def test_copyright_from_dep5_no_empty_copyright_lines(make_dep5_copyright):
+    """The empty first line of a multi-line Copyright field does not end up in
+    the result.
+    """
+    dep5_copyright = make_dep5_copyright(
+        """
+        Files: *
+        Copyright:
+         2017 Jane Doe
+         2018 John Doe
+        License: MIT
+        """
+    )
+    result = _util._copyright_from_dep5("foo.py", dep5_copyright)
+    assert result.copyright_lines == {"2017 Jane Doe", "2018 John Doe"}
+
+
+def test_find_dep5_paragraph_last_match(make_dep5_copyright):
+    """The last paragraph that matches is returned."""
+    dep5_copyright = make_dep5_copyright(
+        """
+        Files: *
+        Copyright: 2017 Jane Doe
+        License: MIT
+
+        Files: doc/*
+        Copyright: 2017 John Doe
+        License: CC0-1.0
+
+        Files: src/*
+        Copyright: 2017 Alice
+        License: 0BSD
+        """
+    )
+    for path in ["foo.py", "doc/foo.rst", "src/foo.py"]:
+        assert _util._dep5_index(dep5_copyright).find_paragraph(
+            path
+        ) is dep5_copyright.find_files_paragraph(path)
+    assert (
+        _util._dep5_index(dep5_copyright)
+        .find_paragraph("doc/foo.rst")
+        .copyright
+        == "2017 John Doe"
+    )
+
+
+def test_literal_prefix_of_glob():
+    """The prefix stops at the first wildcard or escape sequence."""
+    assert _util._literal_prefix_of_glob("README.md") == "README.md"
+    assert _util._literal_prefix_of_glob("doc/*") == "doc/"
+    assert _util._literal_prefix_of_glob("src/?.py") == "src/"
+    assert _util._literal_prefix_of_glob("foo\\*bar") == "foo"
+    assert _util._literal_prefix_of_glob("*") == ""
+
+
 def test_make_copyright_line_simple():
     """Given a simple statement, make it a copyright line."""
     assert _util.make_copyright_line("hello") == "SPDX-FileCopyrightText: hello"